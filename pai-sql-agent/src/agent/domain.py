@@ -28,16 +28,19 @@ class QueryParam:
     @staticmethod
     def from_dict(data: dict) -> "QueryParam":
         """딕셔너리에서 QueryParam 생성 - 팩토리 메서드"""
+        # 기본값 인자를 즉시 평가하면 session_id가 있어도 uuid4()가 호출되므로 필요할 때만 생성
+        session_id = data.get("session_id")
         return QueryParam(
-            session_id=data.get("session_id", str(uuid.uuid4())),
+            session_id=str(uuid.uuid4()) if session_id is None else session_id,
             model=data.get("model", "gpt-4o-mini")
         )
     
     @staticmethod
     def from_request(question: str, **kwargs) -> "QueryParam":
         """요청에서 QueryParam 생성 - 팩토리 메서드"""
+        session_id = kwargs.get("session_id")
         return QueryParam(
-            session_id=kwargs.get("session_id", str(uuid.uuid4())),
+            session_id=str(uuid.uuid4()) if session_id is None else session_id,
             model=kwargs.get("model", "gpt-4o-mini")
         )
     
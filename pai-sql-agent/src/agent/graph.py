@@ -94,8 +94,9 @@ async def create_sql_agent_graph() -> CompiledStateGraph:
         last_message = messages[-1]
         
         # 도구 호출이 있는 경우 → tools로 이동
-        if hasattr(last_message, 'tool_calls') and last_message.tool_calls:
-            logger.info(f"도구 호출 감지: {len(last_message.tool_calls)}개")
+        tool_calls = getattr(last_message, 'tool_calls', None)
+        if tool_calls:
+            logger.info(f"도구 호출 감지: {len(tool_calls)}개")
             return "tools"
         
         # 도구 호출이 없는 경우 → 종료 (최종 응답)
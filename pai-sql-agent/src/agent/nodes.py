@@ -82,13 +82,12 @@ class SQLAgentNode:
             
             logger.info(f"   사용 중인 모델: {current_model}")
             
-            # 사용자 질문 추출 (로깅용)
-            user_question = "질문 없음"
+            # 사용자 질문 추출 (로깅용) - 최신 HumanMessage에서 바로 중단
             if state.get('messages'):
-                for msg in reversed(state['messages']):
-                    if hasattr(msg, 'content') and msg.__class__.__name__ == 'HumanMessage':
-                        user_question = msg.content
-                        break
+                user_question = next(
+                    (msg.content for msg in reversed(state['messages']) if isinstance(msg, HumanMessage)),
+                    "질문 없음"
+                )
                 logger.info(f"분석할 사용자 질문: '{user_question}'")
             
             # Chain 실행
@@ -102,11 +101,12 @@ class SQLAgentNode:
             logger.info(f"Chain 응답 수신: {type(message).__name__}")
             
             # 도구 호출 분석 (기존 로직 유지)
-            if hasattr(message, 'tool_calls') and message.tool_calls:
+            tool_calls = getattr(message, 'tool_calls', None)
+            if tool_calls:
                 logger.info("=" * 60)
-                logger.info(f"도구 호출 결정! 총 {len(message.tool_calls)}개 도구 호출")
+                logger.info(f"도구 호출 결정! 총 {len(tool_calls)}개 도구 호출")
                 
-                for i, tool_call in enumerate(message.tool_calls, 1):
+                for i, tool_call in enumerate(tool_calls, 1):
                     tool_name = tool_call.get('name', 'Unknown')
                     tool_args = tool_call.get('args', {})
                     
@@ -120,8 +120,9 @@ class SQLAgentNode:
                 logger.info("=" * 60)
             else:
                 logger.info("일반 텍스트 응답 (도구 호출 없음)")
-                if hasattr(message, 'content') and message.content:
-                    logger.info(f"   응답 내용: {message.content[:100]}...")
+                content = getattr(message, 'content', None)
+                if content:
+                    logger.info(f"   응답 내용: {content[:100]}...")
             
             return {"messages": [message]}
             
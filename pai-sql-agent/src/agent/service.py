@@ -4,11 +4,13 @@ SQL Agent 서비스
 import asyncio
 import json
 import logging
-from typing import Dict, Any, Optional, AsyncGenerator
+from typing import Dict, Any, List, Optional, AsyncGenerator, AsyncIterator, Callable, Union
 from datetime import datetime
 
 from langchain_core.messages import AIMessageChunk, HumanMessage, ToolMessage
 from langgraph.graph.state import CompiledStateGraph
+from pydantic import TypeAdapter
+from pydantic_core import PydanticSerializationError
 
 from .domain import QueryParam, AgentResponse, ToolCallInfo, ToolResult
 from .nodes import create_initial_state
@@ -16,6 +18,74 @@ from .graph import create_sql_agent_graph
 
 logger = logging.getLogger(__name__)
 
+# 토큰 병합 설정 - 연속 토큰을 하나의 청크로 묶어 SSE 프레임 수를 줄임
+TOKEN_BATCH_SIZE = 8          # 최대 병합 토큰 수
+TOKEN_BATCH_MAX_AGE = 0.04    # 버퍼의 첫 토큰이 들어온 뒤 전송까지 최대 대기 시간 (초)
+
+# 토큰 버퍼 비우기 신호
+_FLUSH = object()
+
+# 스트림 청크 직렬화기 - 모듈 로드 시 1회 생성 (토큰마다 재생성하지 않음)
+_CHUNK_ADAPTER = TypeAdapter(Dict[str, Any])
+
+
+async def _with_flush_ticks(
+    stream: AsyncIterator[Any],
+    flush_deadline: Callable[[], Optional[float]]
+) -> AsyncGenerator[Any, None]:
+    """
+    토큰 버퍼의 전송 시각(flush_deadline, loop.time() 기준)까지 다음 이벤트가 없으면 _FLUSH 신호를 내보냄
+    
+    버퍼가 비어 있으면(None) 태스크 없이 다음 이벤트를 그대로 기다리므로 유휴 시 폴링하지 않음
+    """
+    loop = asyncio.get_running_loop()
+    iterator = stream.__aiter__()
+    pending: Optional[asyncio.Future] = None
+    try:
+        while True:
+            deadline = flush_deadline()
+            if deadline is None and pending is None:
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    return
+                yield item
+                continue
+            
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+            
+            timeout = None if deadline is None else max(deadline - loop.time(), 0.0)
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if not done:
+                yield _FLUSH
+                continue
+            
+            finished, pending = pending, None
+            try:
+                item = finished.result()
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def _to_payload(domain_obj: Any) -> Dict[str, Any]:
+    """도메인 객체를 전송용 딕셔너리로 변환 - 값이 None인 필드는 전송하지 않음"""
+    return {key: value for key, value in domain_obj.to_dict().items() if value is not None}
+
+
+def _to_json_line(domain_obj: Any) -> bytes:
+    """도메인 객체를 JSON 라인(UTF-8 bytes)으로 직렬화 - pydantic-core 직렬화기 사용"""
+    payload = _to_payload(domain_obj)
+    try:
+        return _CHUNK_ADAPTER.dump_json(payload) + b'\n'
+    except PydanticSerializationError:
+        # pydantic-core가 처리하지 못하는 타입은 표준 json으로 폴백
+        return json.dumps(payload, ensure_ascii=False, default=str).encode() + b'\n'
+
 
 class SQLAgentService:
     """
@@ -43,8 +113,13 @@ class SQLAgentService:
         self,
         question: str,
         query_param: QueryParam
-    ) -> AsyncGenerator[str, None]:
-        """스트리밍 쿼리 처리 - 도메인 객체 사용"""
+    ) -> AsyncGenerator[Union[bytes, Dict[str, Any]], None]:
+        """
+        스트리밍 쿼리 처리 - 도메인 객체 사용
+        
+        시작 청크는 라우터가 세션 정보를 추가할 수 있도록 딕셔너리로,
+        나머지 청크는 직렬화된 JSON 라인(bytes)으로 전달
+        """
         
         logger.info(f"스트리밍 쿼리 처리 시작: {question[:50]}...")
         logger.info(f"서비스 초기화 상태: {self._initialized}")
@@ -61,24 +136,57 @@ class SQLAgentService:
                 session_id=query_param.session_id,
                 response_type="start"
             )
-            yield json.dumps(start_response.to_dict(), ensure_ascii=False) + '\n'
+            yield _to_payload(start_response)
             
             # 도구 호출 상태 관리
             has_tool_calls = False
             
+            # 토큰 병합 버퍼 (첫 토큰 기준 TOKEN_BATCH_MAX_AGE가 지나면 전송)
+            loop = asyncio.get_running_loop()
+            token_buffer: List[str] = []
+            token_message_id: Optional[str] = None
+            token_deadline: Optional[float] = None
+            
+            def buffer_token(content: str):
+                """토큰을 버퍼에 추가 - 첫 토큰이면 전송 시각 설정"""
+                nonlocal token_deadline
+                if not token_buffer:
+                    token_deadline = loop.time() + TOKEN_BATCH_MAX_AGE
+                token_buffer.append(content)
+            
+            def flush_tokens() -> bytes:
+                """버퍼의 토큰을 하나의 ai_message 청크로 직렬화"""
+                nonlocal token_deadline
+                response = AgentResponse(
+                    content="".join(token_buffer),
+                    session_id=query_param.session_id,
+                    message_id=token_message_id
+                )
+                token_buffer.clear()
+                token_deadline = None
+                return _to_json_line(response)
+            
             logger.info("LangGraph 스트리밍 시작")
             logger.info(f"세션 ID: {query_param.session_id}")
             
             # LangGraph 스트리밍 실행
             stream_count = 0
-            async for state_map in self._agent_graph.astream(
-                {"messages": [HumanMessage(content=question)]},
-                config={
-                    "configurable": {"thread_id": query_param.session_id},
-                    "recursion_limit": 50
-                },
-                stream_mode="messages",
+            async for state_map in _with_flush_ticks(
+                self._agent_graph.astream(
+                    {"messages": [HumanMessage(content=question)]},
+                    config={
+                        "configurable": {"thread_id": query_param.session_id},
+                        "recursion_limit": 50
+                    },
+                    stream_mode="messages",
+                ),
+                lambda: token_deadline
             ):
+                # 버퍼의 첫 토큰이 TOKEN_BATCH_MAX_AGE만큼 기다렸으면 전송
+                if state_map is _FLUSH:
+                    yield flush_tokens()
+                    continue
+                
                 stream_count += 1
                 logger.info(f"스트림 이벤트 #{stream_count} 수신: {type(state_map)}")
                 message, metadata = state_map
@@ -86,8 +194,10 @@ class SQLAgentService:
                 # AI 메시지 처리
                 if isinstance(message, AIMessageChunk):
                     # 도구 호출 감지
-                    if hasattr(message, 'tool_calls') and message.tool_calls:
+                    if message.tool_calls:
                         has_tool_calls = True
+                        if token_buffer:
+                            yield flush_tokens()
                         
                         for tool_call in message.tool_calls:
                             tool_name = tool_call.get('name')
@@ -99,37 +209,43 @@ class SQLAgentService:
                                     message_id=message.id,
                                     args=tool_call.get('args', {})
                                 )
-                                yield json.dumps(tool_info.to_dict(), ensure_ascii=False) + '\n'
+                                yield _to_json_line(tool_info)
                     
-                    # 일반 메시지 내용
+                    # 일반 메시지 내용 - 버퍼에 모아 병합 전송
                     if message.content and not has_tool_calls:
-                        response = AgentResponse(
-                            content=message.content,
-                            session_id=query_param.session_id,
-                            message_id=message.id
-                        )
-                        yield json.dumps(response.to_dict(), ensure_ascii=False) + '\n'
+                        if token_buffer and message.id != token_message_id:
+                            yield flush_tokens()
+                        token_message_id = message.id
+                        buffer_token(message.content)
+                        if len(token_buffer) >= TOKEN_BATCH_SIZE:
+                            yield flush_tokens()
                 
                 # 도구 실행 결과 처리
                 elif isinstance(message, ToolMessage):
+                    if token_buffer:
+                        yield flush_tokens()
                     tool_result = ToolResult(
                         tool_name=message.name,
                         content=message.content,
                         session_id=query_param.session_id,
                         message_id=message.id
                     )
-                    yield json.dumps(tool_result.to_dict(), ensure_ascii=False) + '\n'
+                    yield _to_json_line(tool_result)
                     
                     # 상태 초기화
                     has_tool_calls = False
             
+            # 남은 토큰 전송
+            if token_buffer:
+                yield flush_tokens()
+            
             # 완료 신호
             complete_response = AgentResponse(
                 content="SQL 분석이 완료되었습니다.",
                 session_id=query_param.session_id,
                 response_type="complete"
             )
-            yield json.dumps(complete_response.to_dict(), ensure_ascii=False) + '\n'
+            yield _to_json_line(complete_response)
             
         except Exception as e:
             logger.error(f"스트리밍 쿼리 처리 오류: {e}")
@@ -138,7 +254,7 @@ class SQLAgentService:
                 session_id=query_param.session_id,
                 response_type="error"
             )
-            yield json.dumps(error_response.to_dict(), ensure_ascii=False) + '\n'
+            yield _to_json_line(error_response)
 
 
 # 싱글톤 인스턴스를 위한 전역 변수
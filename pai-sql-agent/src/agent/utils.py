@@ -69,7 +69,7 @@ class TokenCounter:
         elif isinstance(message, AIMessage):
             overhead = 8   # AI 메시지 오버헤드
             # 도구 호출이 있는 경우 추가 토큰
-            if hasattr(message, 'tool_calls') and message.tool_calls:
+            if message.tool_calls:
                 overhead += len(message.tool_calls) * 20
         elif isinstance(message, ToolMessage):
             overhead = 15  # 도구 메시지 오버헤드
@@ -8,7 +8,6 @@ import hashlib
 import hmac
 import time
 from typing import Dict, List, Optional, Any, Union
-from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
 
@@ -50,6 +49,11 @@ class SGISResponse:
         return self.err_msg if not self.is_success else None
 
 
+# 인증 토큰 설정
+TOKEN_LIFETIME = 3600.0          # 토큰 유효 시간 (초)
+TOKEN_REFRESH_RATIO = 0.8        # 유효 시간의 80% 경과 시 갱신
+
+
 class SGISClient:
     """
     SGIS API 클라이언트
@@ -83,7 +87,7 @@ class SGISClient:
         # HTTP 클라이언트 초기화
         self._client = httpx.AsyncClient(timeout=30.0)
         self._access_token: Optional[str] = None
-        self._token_expires_at: Optional[datetime] = None
+        self._token_refresh_at: float = 0.0  # time.monotonic() 기준 갱신 시점
     
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입"""
@@ -103,14 +107,15 @@ class SGISClient:
         SGIS API 인증 토큰 획득
         Docker 환경변수의 service_id, security_key 사용
         
+        캐시된 토큰이 유효 시간의 80% 이내이면 재인증 없이 반환
+        
         Returns:
             bool: 인증 성공 여부
         """
         try:
             # 기존 토큰이 유효한지 확인
-            if self._access_token and self._token_expires_at:
-                if datetime.now() < self._token_expires_at:
-                    return True
+            if self._access_token and time.monotonic() < self._token_refresh_at:
+                return True
             
             # 새 토큰 요청
             auth_url = f"{self.base_url}/auth/authentication.json"
@@ -129,8 +134,8 @@ class SGISClient:
                 result = data.get("result", {})
                 self._access_token = result.get("accessToken")
                 
-                # 토큰 만료 시간 설정 (1시간)
-                self._token_expires_at = datetime.now() + timedelta(hours=1)
+                # 만료 전에 여유를 두고 갱신하도록 갱신 시점 설정 (시스템 시계 변경에 영향받지 않는 monotonic 기준)
+                self._token_refresh_at = time.monotonic() + TOKEN_LIFETIME * TOKEN_REFRESH_RATIO
                 
                 return True
             else:
@@ -2,7 +2,8 @@
 Database Repository - SQL Agent
 """
 import logging
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from sqlalchemy import text
@@ -10,6 +11,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
+# 동일한 쿼리 문자열은 같은 TextClause를 재사용하여 바인드 파라미터 파싱과 컴파일 캐시 키 생성을 생략
+_cached_text = lru_cache(maxsize=256)(text)
+
 
 class DatabaseRepository:
     """
@@ -32,13 +36,13 @@ class DatabaseRepository:
         """
         self.session = session
     
-    async def execute_raw_query(self, query: str, params: tuple = None) -> List[Dict[str, Any]]:
+    async def execute_raw_query(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         원시 SQL 쿼리 실행 - SQL Agent 도구용
         
         Args:
             query: 실행할 SQL 쿼리 문자열
-            params: 쿼리 파라미터 (옵션)
+            params: 바인드 파라미터 (옵션, `:name` 형식 자리표시자와 매핑)
             
         Returns:
             List[Dict[str, Any]]: 쿼리 결과를 딕셔너리 리스트로 반환
@@ -51,9 +55,9 @@ class DatabaseRepository:
             
             # SQL 쿼리 실행 (파라미터 지원)
             if params:
-                result = await self.session.execute(text(query), params)
+                result = await self.session.execute(_cached_text(query), params)
             else:
-                result = await self.session.execute(text(query))
+                result = await self.session.execute(_cached_text(query))
             
             # 결과를 딕셔너리 리스트로 변환
             rows = result.fetchall()
@@ -77,6 +81,40 @@ class DatabaseRepository:
             logger.error(f"실행한 쿼리: {query}")
             raise
     
+    async def _get_asyncpg_connection(self):
+        """
+        세션이 사용 중인 풀 연결의 asyncpg 드라이버 연결 반환
+        
+        Returns:
+            asyncpg 연결 (asyncpg 드라이버가 아니면 None)
+        """
+        if self.session.get_bind().dialect.driver != "asyncpg":
+            return None
+        
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        return raw_connection.driver_connection
+    
+    async def fetch_scalar(self, query: str) -> Any:
+        """
+        단일 값 조회 - SELECT 1 같은 단순 쿼리용
+        
+        asyncpg이면 fetchval을 직접 호출하여 SQLAlchemy 결과 행 래핑과
+        딕셔너리 변환을 생략 (연결은 동일한 풀/트랜잭션 사용)
+        
+        Args:
+            query: 바인드 파라미터가 없는 SQL 쿼리
+            
+        Returns:
+            Any: 첫 번째 행의 첫 번째 컬럼 값 (결과가 없으면 None)
+        """
+        driver_connection = await self._get_asyncpg_connection()
+        if driver_connection is not None:
+            return await driver_connection.fetchval(query)
+        
+        result = await self.session.execute(_cached_text(query))
+        return result.scalar()
+    
     async def get_all_tables(self) -> List[str]:
         """
         모든 테이블 목록 조회
@@ -103,5 +141,40 @@ class DatabaseRepository:
             logger.error(f"테이블 목록 조회 오류: {e}")
             return []
     
+    async def count_table_rows(self, tables: List[str]) -> Dict[str, int]:
+        """
+        여러 테이블의 레코드 수를 단일 쿼리(UNION ALL)로 조회
+        
+        Args:
+            tables: 테이블 이름 리스트 (get_all_tables 결과)
+            
+        Returns:
+            Dict[str, int]: 테이블 이름 → 레코드 수
+        """
+        if not tables:
+            return {}
+        
+        try:
+            # 테이블 이름은 식별자로 인용하고, 결과 매핑은 인덱스로 처리
+            preparer = self.session.get_bind().dialect.identifier_preparer
+            query = " UNION ALL ".join(
+                f"SELECT {index} AS idx, COUNT(*) AS count FROM {preparer.quote(table_name)}"
+                for index, table_name in enumerate(tables)
+            )
+            
+            driver_connection = await self._get_asyncpg_connection()
+            if driver_connection is not None:
+                rows = await driver_connection.fetch(query)
+            else:
+                rows = (await self.session.execute(text(query))).fetchall()
+            counts = {tables[idx]: count for idx, count in rows}
+            
+            logger.info(f"테이블 레코드 수 조회 완료: {len(counts)}개 테이블")
+            return counts
+            
+        except Exception as e:
+            logger.error(f"테이블 레코드 수 조회 오류: {e}")
+            raise
+    
     # get_table_schema, get_table_sample_data, get_database_statistics 메서드들 제거됨
     # 실제로는 execute_raw_query와 get_all_tables만 사용됨
\ No newline at end of file
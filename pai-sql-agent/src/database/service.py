@@ -4,6 +4,7 @@ Repository 패턴 기반 데이터베이스 비즈니스 로직 처리
 """
 import asyncio
 import logging
+import time
 from typing import List, Dict, Any, Optional, Callable
 from contextlib import AbstractContextManager
 from datetime import datetime
@@ -17,6 +18,9 @@ from .settings import get_database_settings
 
 logger = logging.getLogger(__name__)
 
+# 테이블 목록 캐시 유지 시간 (초) - 스키마는 거의 변하지 않음
+TABLES_CACHE_TTL = 300.0
+
 
 class DatabaseService:
     """데이터베이스 서비스 - 독립적 서비스 (순환참조 제거)"""
@@ -27,20 +31,29 @@ class DatabaseService:
             session_factory: 세션 팩토리 함수
         """
         self.session_factory = session_factory
+        self._tables_cache: Optional[List[str]] = None
+        self._tables_cached_at = 0.0
         logger.info("DatabaseService 초기화 완료 (독립적 서비스)")
     
     # get_population_by_region, get_top_regions_by_population 메서드들 제거됨
     # 실제로는 execute_custom_query만 사용됨
     
-    async def execute_custom_query(self, query: str) -> QueryResult:
-        """사용자 정의 쿼리 실행"""
+    async def execute_custom_query(self, query: str, params: Optional[Dict[str, Any]] = None) -> QueryResult:
+        """
+        사용자 정의 쿼리 실행
+        
+        Args:
+            query: SQL 쿼리 (값은 `:name` 자리표시자로 작성)
+            params: 바인드 파라미터 - 문자열 치환 대신 사용하여 SQL 인젝션을 막고
+                동일한 쿼리 텍스트로 prepared statement를 재사용
+        """
         start_time = datetime.now()
         
         try:
             async with self.session_factory() as session:
                 # Repository가 데이터 제어권 담당
                 repository = DatabaseRepository(session)
-                results = await repository.execute_raw_query(query)
+                results = await repository.execute_raw_query(query, params)
                 
                 execution_time = (datetime.now() - start_time).total_seconds()
                 
@@ -51,7 +64,7 @@ class DatabaseService:
                     execution_time=execution_time,
                     query=query
                 )
-                
+        
         except Exception as e:
             execution_time = (datetime.now() - start_time).total_seconds()
             logger.error(f"쿼리 실행 오류: {e}")
@@ -64,19 +77,66 @@ class DatabaseService:
                 query=query
             )
     
+    async def fetch_scalar(self, query: str) -> Any:
+        """단일 값 조회 - Repository에 위임 (헬스체크 등 단순 쿼리용, 오류는 호출자에게 전달)"""
+        async with self.session_factory() as session:
+            repository = DatabaseRepository(session)
+            return await repository.fetch_scalar(query)
+    
     async def get_all_tables(self) -> List[str]:
-        """모든 테이블 목록 조회 - Repository에 위임"""
+        """
+        모든 테이블 목록 조회 - Repository에 위임
+        
+        information_schema 조회 결과를 TABLES_CACHE_TTL 동안 캐시
+        """
+        if (
+            self._tables_cache is not None
+            and time.monotonic() - self._tables_cached_at < TABLES_CACHE_TTL
+        ):
+            return list(self._tables_cache)
+        
         try:
             async with self.session_factory() as session:
                 repository = DatabaseRepository(session)
-                return await repository.get_all_tables()
+                tables = await repository.get_all_tables()
         except Exception as e:
             logger.error(f"테이블 목록 조회 오류: {e}")
             return []
+        
+        # 조회 실패 시 빈 목록이 반환되므로 비어 있지 않은 결과만 캐시
+        if tables:
+            self._tables_cache = tables
+            self._tables_cached_at = time.monotonic()
+        return list(tables)
+    
+    async def get_table_row_counts(self, tables: List[str]) -> Dict[str, int]:
+        """
+        테이블별 레코드 수 조회 - Repository에 위임 (단일 쿼리)
+        
+        단일 쿼리가 실패하면 (테이블 하나라도 조회 불가 시 전체 실패) 테이블별 조회로 대체
+        """
+        try:
+            async with self.session_factory() as session:
+                repository = DatabaseRepository(session)
+                return await repository.count_table_rows(tables)
+        except Exception as e:
+            logger.warning(f"테이블 레코드 수 일괄 조회 실패, 테이블별 조회로 대체: {e}")
+        
+        counts: Dict[str, int] = {}
+        for table_name in tables:
+            try:
+                async with self.session_factory() as session:
+                    repository = DatabaseRepository(session)
+                    counts.update(await repository.count_table_rows([table_name]))
+            except Exception as e:
+                logger.error(f"테이블 레코드 수 조회 오류 ({table_name}): {e}")
+                counts[table_name] = 0
+        return counts
 
 
 # 싱글톤 인스턴스를 위한 전역 변수
 _database_service: Optional[DatabaseService] = None
+_session_factory_instance: Optional[DatabaseSessionFactory] = None
 _database_lock = asyncio.Lock()
 
 
@@ -92,7 +152,7 @@ async def get_database_service() -> DatabaseService:
     데이터베이스 서비스 싱글톤 인스턴스 반환
     스레드 안전한 지연 초기화로 성능 최적화
     """
-    global _database_service
+    global _database_service, _session_factory_instance
     
     if _database_service is None:
         async with _database_lock:
@@ -101,8 +161,8 @@ async def get_database_service() -> DatabaseService:
                 logger.info("DatabaseService 싱글톤 인스턴스 생성 시작")
                 
                 settings = get_database_settings()
-                session_factory_instance = DatabaseSessionFactory(settings)
-                session_factory = session_factory_instance.get_session
+                _session_factory_instance = DatabaseSessionFactory(settings)
+                session_factory = _session_factory_instance.get_session
                 
                 _database_service = create_database_service(session_factory)
                 logger.info("DatabaseService 싱글톤 인스턴스 생성 완료")
@@ -111,9 +171,12 @@ async def get_database_service() -> DatabaseService:
 
 
 async def close_database_service():
-    """데이터베이스 서비스 싱글톤 정리"""
-    global _database_service
+    """데이터베이스 서비스 싱글톤 정리 (연결 풀 해제 포함)"""
+    global _database_service, _session_factory_instance
     async with _database_lock:
         if _database_service is not None:
             logger.info("DatabaseService 싱글톤 인스턴스 정리")
             _database_service = None
+        if _session_factory_instance is not None:
+            await _session_factory_instance.close()
+            _session_factory_instance = None
@@ -15,7 +15,7 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker
 )
-from sqlalchemy.pool import NullPool, StaticPool
+from sqlalchemy.pool import StaticPool
 
 from .settings import DatabaseSettings
 from .entities import Base
@@ -54,9 +54,19 @@ class DatabaseSessionFactory:
             async_url = self.settings.DATABASE_URL.replace(
                 "postgresql://", "postgresql+asyncpg://"
             )
+            # 연결 풀 재사용 - 요청마다 새 연결을 맺지 않고, 체크아웃 시 pre_ping으로 끊긴 연결 교체
             engine = create_async_engine(
                 async_url,
-                poolclass=NullPool,  # NullPool 사용 시 pool 관련 설정 제거
+                pool_size=self.settings.DB_POOL_SIZE,
+                max_overflow=self.settings.DB_MAX_OVERFLOW,
+                pool_timeout=self.settings.DB_POOL_TIMEOUT,
+                pool_recycle=self.settings.DB_POOL_RECYCLE,
+                pool_pre_ping=self.settings.DB_POOL_PRE_PING,
+                # 반복 실행되는 쿼리(SELECT 1, COUNT 등)의 PARSE 단계를 연결별 캐시로 생략
+                connect_args={
+                    "statement_cache_size": self.settings.DB_STATEMENT_CACHE_SIZE,
+                    "prepared_statement_cache_size": self.settings.DB_STATEMENT_CACHE_SIZE,
+                },
                 echo=self.settings.DB_ECHO,
                 future=True
             )
@@ -33,6 +33,7 @@ class DatabaseSettings(BaseSettings):
     # 성능 최적화 설정
     DB_POOL_PRE_PING: bool = Field(default=True, description="연결 사전 핑 여부")
     DB_POOL_RESET_ON_RETURN: str = Field(default="commit", description="반환 시 리셋 방식")
+    DB_STATEMENT_CACHE_SIZE: int = Field(default=256, ge=0, le=10000, description="연결별 prepared statement 캐시 크기 (asyncpg)")
     
     class Config:
         env_prefix = "DB_"
@@ -0,0 +1,104 @@
+# tests/agent/test_service.py
+import asyncio
+import json
+
+import pytest
+from langchain_core.messages import AIMessageChunk, ToolMessage
+
+from src.agent.domain import QueryParam
+from src.agent.service import SQLAgentService, TOKEN_BATCH_MAX_AGE, TOKEN_BATCH_SIZE
+
+
+class FakeGraph:
+    """실제 모델처럼 일정 간격으로 토큰을 내보내는 가짜 워크플로우"""
+
+    def __init__(self, tokens, interval, stall_after=None, stall=0.0):
+        self._tokens = tokens
+        self._interval = interval
+        self._stall_after = stall_after
+        self._stall = stall
+
+    async def astream(self, *args, **kwargs):
+        for i, token in enumerate(self._tokens):
+            if i == self._stall_after:
+                await asyncio.sleep(self._stall)
+            await asyncio.sleep(self._interval)
+            yield AIMessageChunk(content=token, id="run-1"), {}
+
+
+async def collect(graph):
+    """스트림 청크를 (수신 시각, 청크 딕셔너리) 목록으로 수집"""
+    service = SQLAgentService(graph)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    chunks = []
+    async for chunk in service.process_query_stream(
+        question="테스트", query_param=QueryParam(session_id="s1")
+    ):
+        data = chunk if isinstance(chunk, dict) else json.loads(chunk)
+        chunks.append((loop.time() - started, data))
+    return chunks
+
+
+def ai_messages(chunks):
+    return [data for _, data in chunks if data["type"] == "ai_message"]
+
+
+class TestTokenBatching:
+    """ai_message 토큰 병합 테스트"""
+
+    @pytest.mark.parametrize("interval", [0.01, 0.02])
+    async def test_tokens_spaced_like_a_model_are_coalesced(self, interval):
+        """10~20ms 간격 토큰도 여러 개씩 묶여 전송"""
+        # given
+        tokens = [f"t{i} " for i in range(40)]
+
+        # when
+        messages = ai_messages(await collect(FakeGraph(tokens, interval)))
+
+        # then
+        assert "".join(m["content"] for m in messages) == "".join(tokens)
+        assert len(messages) <= len(tokens) // 2
+
+    async def test_batch_size_limits_tokens_per_chunk(self):
+        """간격 없이 들어온 토큰은 TOKEN_BATCH_SIZE개씩 전송"""
+        # given
+        tokens = [f"t{i} " for i in range(TOKEN_BATCH_SIZE * 3)]
+
+        # when
+        messages = ai_messages(await collect(FakeGraph(tokens, 0.0)))
+
+        # then
+        assert [m["content"] for m in messages] == [
+            "".join(tokens[i:i + TOKEN_BATCH_SIZE])
+            for i in range(0, len(tokens), TOKEN_BATCH_SIZE)
+        ]
+
+    async def test_buffered_tokens_are_sent_before_a_stall_ends(self):
+        """모델이 멈춰도 버퍼의 토큰은 TOKEN_BATCH_MAX_AGE 내에 전송"""
+        # given
+        stall = 0.5
+        graph = FakeGraph(["a", "b", "c", "d"], 0.005, stall_after=2, stall=stall)
+
+        # when
+        chunks = await collect(graph)
+
+        # then
+        first_at, first = next((t, d) for t, d in chunks if d["type"] == "ai_message")
+        assert first["content"] == "ab"
+        assert first_at < stall / 2
+        assert first_at < 0.01 + TOKEN_BATCH_MAX_AGE * 3
+
+    async def test_tool_events_flush_pending_tokens(self):
+        """도구 결과가 오면 대기 중인 토큰을 먼저 전송"""
+        # given
+        class ToolGraph:
+            async def astream(self, *args, **kwargs):
+                yield AIMessageChunk(content="조회 전 ", id="run-1"), {}
+                yield ToolMessage(content="rows", name="sql_db_query", tool_call_id="t1", id="tm"), {}
+
+        # when
+        chunks = await collect(ToolGraph())
+
+        # then
+        assert [d["type"] for _, d in chunks] == ["start", "ai_message", "tool_result", "complete"]
@@ -0,0 +1,104 @@
+"""
+응답 캐시 - 짧은 TTL의 인메모리 캐시
+헬스체크, DB 정보처럼 자주 호출되지만 거의 변하지 않는 응답용
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTTLCache:
+    """
+    키별 TTL 캐시
+    
+    - 만료 전에는 DB 조회 없이 메모리에서 반환
+    - 캐시 미스 시 키별 Lock으로 한 번만 계산 (동시 요청 몰림 방지)
+    - 계산 중 예외가 발생하면 캐시하지 않고 호출자에게 전달
+    - stale_while_revalidate 사용 시 만료된 값을 바로 반환하고 백그라운드에서 다시 계산
+    """
+    
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Any, float]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._refresh_tasks: Set[asyncio.Task] = set()
+    
+    def _get_fresh(self, key: str) -> Tuple[bool, Any]:
+        """만료되지 않은 캐시 값 조회"""
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            return True, entry[0]
+        return False, None
+    
+    async def get_or_set(
+        self,
+        key: str,
+        ttl: float,
+        factory: Callable[[], Awaitable[Any]],
+        stale_while_revalidate: bool = False
+    ) -> Any:
+        """
+        캐시 값 반환, 없거나 만료되었으면 factory로 계산 후 저장
+        
+        stale_while_revalidate=True이고 만료된 값이 남아 있으면 그 값을 바로 반환하고
+        갱신은 백그라운드 태스크로 한 번만 실행 (요청이 없으면 갱신도 없음)
+        """
+        hit, value = self._get_fresh(key)
+        if hit:
+            return value
+        
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        entry = self._entries.get(key)
+        if stale_while_revalidate and entry is not None:
+            if not lock.locked():
+                task = asyncio.create_task(self._refresh(key, ttl, factory, lock))
+                # 태스크가 끝나기 전에 가비지 컬렉션되지 않도록 참조 유지
+                self._refresh_tasks.add(task)
+                task.add_done_callback(self._refresh_tasks.discard)
+            return entry[0]
+        
+        async with lock:
+            # 대기하는 동안 다른 요청이 채웠을 수 있음
+            hit, value = self._get_fresh(key)
+            if hit:
+                return value
+            
+            value = await factory()
+            self._entries[key] = (value, time.monotonic() + ttl)
+            return value
+    
+    async def _refresh(
+        self,
+        key: str,
+        ttl: float,
+        factory: Callable[[], Awaitable[Any]],
+        lock: asyncio.Lock
+    ):
+        """백그라운드 갱신 - 실패하면 기존 값을 유지하고 다음 요청에서 다시 시도"""
+        async with lock:
+            hit, _ = self._get_fresh(key)
+            if hit:
+                return
+            try:
+                value = await factory()
+            except Exception as e:
+                logger.warning(f"캐시 갱신 실패 ({key}): {e}")
+                return
+            self._entries[key] = (value, time.monotonic() + ttl)
+    
+    def set(self, key: str, value: Any, ttl: float):
+        """캐시 값 직접 저장 (백그라운드 갱신용)"""
+        self._entries[key] = (value, time.monotonic() + ttl)
+    
+    def invalidate(self, key: Optional[str] = None):
+        """캐시 무효화 (key가 없으면 전체)"""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+
+# 애플리케이션 전역 응답 캐시
+response_cache = AsyncTTLCache()
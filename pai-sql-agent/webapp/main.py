@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import uvicorn
 from contextlib import asynccontextmanager
@@ -21,6 +22,7 @@ async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리 - 직접 생성 방식 기반"""
     # 시작 시
     logger.info("애플리케이션 시작 (직접 생성 방식 기반)")
+    background_tasks = []
     
     try:
         # 데이터베이스 연결 테스트
@@ -34,6 +36,13 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning(f"데이터베이스 초기화 중 오류: {e}")
         
+        # 백그라운드 캐시 준비 - 헬스체크는 주기적으로 갱신하고,
+        # DB 정보는 시작 시 한 번만 채운 뒤 요청이 있을 때 갱신
+        background_tasks = [
+            asyncio.create_task(data.run_database_probe_loop()),
+            asyncio.create_task(data.warm_database_info()),
+        ]
+        
         yield
         
     except Exception as e:
@@ -42,6 +51,9 @@ async def lifespan(app: FastAPI):
     finally:
         # 종료 시 - 싱글톤 서비스들 정리
         logger.info("애플리케이션 종료 시작")
+        for task in background_tasks:
+            task.cancel()
+        await asyncio.gather(*background_tasks, return_exceptions=True)
         try:
             await close_sql_agent_service()
             await close_database_service()
@@ -98,10 +110,8 @@ async def root():
 async def health_check():
     """헬스 체크 엔드포인트 - 직접 생성 방식 기반"""
     try:
-        # 데이터베이스 연결 테스트
-        db_service = await get_database_service()
-        test_result = await db_service.execute_custom_query("SELECT 1 as test")
-        db_healthy = test_result.success
+        # 데이터베이스 연결 테스트 (짧은 TTL로 캐시된 결과 사용)
+        db_healthy = await data.is_database_connected()
         
         return {
             "status": "healthy" if db_healthy else "unhealthy",
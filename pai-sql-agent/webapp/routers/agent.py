@@ -1,40 +1,83 @@
 """
 SQL Agent API 라우터 - DI 패턴 적용
 """
+import asyncio
 import logging
 import json
 import uuid
 import time
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, AsyncIterator
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
 
 from webapp.models import QueryRequest
+from webapp.sse import SSE_HEADERS, sse_frame
 from src.agent.domain import QueryParam
 from src.agent.service import get_sql_agent_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/agent", tags=["agent"])
 
+# 에이전트 생산자와 SSE 전송 사이의 버퍼 크기 (백프레셔 한도)
+_STREAM_QUEUE_SIZE = 32
 
-def safe_json_dumps(obj):
-    """안전한 JSON 직렬화"""
+# 생산자 종료 신호
+_STREAM_END = object()
+
+
+async def _buffered_stream(
+    stream: AsyncIterator[Any],
+    maxsize: int = _STREAM_QUEUE_SIZE
+) -> AsyncGenerator[Any, None]:
+    """
+    별도 태스크가 스트림을 읽어 크기 제한 큐에 넣고, 호출자는 큐에서 꺼내 전송
+    
+    - 클라이언트 쓰기가 느려도 큐가 찰 때까지 에이전트는 계속 진행
+    - 큐가 가득 차면 생산자가 대기하여 메모리 사용량이 제한됨
+    - 소비자가 종료(클라이언트 연결 해제 포함)되면 생산자 태스크를 취소
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+    
+    async def produce():
+        try:
+            async for item in stream:
+                await queue.put(item)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(_STREAM_END)
+    
+    producer = asyncio.create_task(produce())
     try:
-        return json.dumps(obj, ensure_ascii=False, default=str)
+        while True:
+            item = await queue.get()
+            if item is _STREAM_END:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
+
+
+def safe_json_dumps(obj) -> bytes:
+    """안전한 JSON 직렬화 (UTF-8 bytes 반환)"""
+    try:
+        return json.dumps(obj, ensure_ascii=False, default=str).encode()
     except Exception as e:
         logger.warning(f"JSON 직렬화 실패: {e}")
         return json.dumps({
             "type": "error",
             "content": f"직렬화 오류: {str(e)}",
             "timestamp": time.time()
-        }, ensure_ascii=False)
+        }, ensure_ascii=False).encode()
 
 
 @router.post("/query")
 async def query_sql_agent_stream(request: QueryRequest) -> StreamingResponse:
     """SQL Agent 스트리밍 API - 멀티턴 대화 지원"""
     
-    async def generate_stream():
+    async def generate_stream() -> AsyncGenerator[bytes, None]:
         # 세션 관리 개선: session_id를 thread_id로 사용
         session_id = request.session_id or str(uuid.uuid4())
         thread_id = request.thread_id or session_id  # thread_id가 없으면 session_id 사용
@@ -58,31 +101,31 @@ async def query_sql_agent_stream(request: QueryRequest) -> StreamingResponse:
             # 멀티턴 대화를 위한 스트리밍 처리
             logger.info("에이전트 서비스 스트리밍 시작")
             chunk_count = 0
-            async for chunk in agent_service.process_query_stream(
-                question=request.question,
-                query_param=query_param
+            async for chunk in _buffered_stream(
+                agent_service.process_query_stream(
+                    question=request.question,
+                    query_param=query_param
+                )
             ):
                 chunk_count += 1
                 
-                # JSON 문자열을 딕셔너리로 파싱
-                try:
-                    if isinstance(chunk, str):
-                        chunk_data = json.loads(chunk.strip())
-                    else:
-                        chunk_data = chunk
-                    
-                    logger.info(f"스트림 청크 #{chunk_count} 수신: {chunk_data.get('type', 'unknown')}")
-                    
-                    # 클라이언트에게 세션 정보 전달
-                    if chunk_data.get("type") == "start":
-                        chunk_data["session_id"] = session_id
-                        chunk_data["thread_id"] = thread_id
-                    
-                    yield f"data: {safe_json_dumps(chunk_data)}\n\n"
-                    
-                except json.JSONDecodeError:
-                    logger.warning(f"JSON 파싱 실패: {chunk}")
-                    yield f"data: {chunk}\n\n"
+                # 이미 직렬화된 청크는 파싱/재직렬화 없이 전달
+                if isinstance(chunk, (bytes, bytearray)):
+                    yield sse_frame(chunk.strip())
+                    continue
+                if isinstance(chunk, str):
+                    yield sse_frame(chunk.strip().encode())
+                    continue
+                
+                # 딕셔너리 청크(시작 청크)만 세션 정보를 추가한 뒤 직렬화
+                logger.info(f"스트림 청크 #{chunk_count} 수신: {chunk.get('type', 'unknown')}")
+                
+                # 클라이언트에게 세션 정보 전달
+                if chunk.get("type") == "start":
+                    chunk["session_id"] = session_id
+                    chunk["thread_id"] = thread_id
+                
+                yield sse_frame(safe_json_dumps(chunk))
             
         except Exception as e:
             logger.error(f"스트리밍 오류: {e}")
@@ -93,16 +136,12 @@ async def query_sql_agent_stream(request: QueryRequest) -> StreamingResponse:
                 "thread_id": thread_id,
                 "timestamp": time.time()
             }
-            yield f"data: {safe_json_dumps(error_chunk)}\n\n"
+            yield sse_frame(safe_json_dumps(error_chunk))
     
     return StreamingResponse(
         generate_stream(),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "Access-Control-Allow-Origin": "*"
-        }
+        headers=SSE_HEADERS
     )
 
 
@@ -1,104 +1,248 @@
+import asyncio
 import logging
-from fastapi import APIRouter
+import orjson
+from datetime import datetime
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List
+from fastapi import APIRouter, Response
+from fastapi.responses import StreamingResponse
 
+from webapp.cache import response_cache
 from webapp.models import HealthResponse
+from webapp.sse import SSE_HEADERS, sse_frame
 from src.database.service import get_database_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/data", tags=["data"])
 
+# 응답 캐시 TTL (초) - 프로브/대시보드 호출이 매번 DB를 조회하지 않도록 함
+# (데이터베이스 정보는 TTL이 지나면 이전 스냅샷을 반환하면서 요청 시에만 백그라운드로 갱신)
+HEALTH_CACHE_TTL = 2.0
+DATABASE_INFO_CACHE_TTL = 60.0
 
-@router.get("/health", response_model=HealthResponse)
-async def health_check():
-    """서비스 상태 확인 - DI 기반"""
+# 백그라운드 갱신 주기 (초) - 요청 수와 무관하게 주기당 한 번만 DB 조회
+HEALTH_PROBE_INTERVAL = 5.0
+
+# /database-info/stream 연결 유지용 주석 전송 주기 (초) - 프록시 유휴 타임아웃 방지
+DATABASE_INFO_KEEPALIVE_INTERVAL = 15.0
+
+# 데이터베이스 정보 스냅샷이 새로 만들어질 때마다 스트림 구독자를 깨움
+_database_info_updated = asyncio.Event()
+
+
+async def _probe_database() -> bool:
+    """간단한 쿼리로 데이터베이스 연결 확인 (결과 행 변환 없이 단일 값만 조회)"""
     try:
-        # 데이터베이스 연결 확인
-        db_connected = False
+        db_service = await get_database_service()
+        return await db_service.fetch_scalar("SELECT 1") == 1
+    except Exception as e:
+        logger.warning(f"데이터베이스 연결 확인 실패: {e}")
+        return False
+
+
+async def is_database_connected() -> bool:
+    """
+    데이터베이스 연결 상태 (HEALTH_CACHE_TTL 동안 캐시)
+    
+    백그라운드 프로브가 동작 중이면 항상 캐시에서 반환되고,
+    프로브 결과가 오래된 경우에만 직접 SELECT 1을 실행
+    """
+    return await response_cache.get_or_set("db_connected", HEALTH_CACHE_TTL, _probe_database)
+
+
+async def _refresh_cache_periodically(
+    key: str,
+    interval: float,
+    factory: Callable[[], Awaitable[Any]]
+):
+    """주기적으로 factory 결과를 응답 캐시에 저장 (lifespan에서 태스크로 실행)"""
+    while True:
         try:
-            db_service = await get_database_service()
-            # 간단한 쿼리로 연결 확인
-            result = await db_service.execute_custom_query("SELECT 1 as test")
-            db_connected = result.success
+            value = await factory()
         except Exception as e:
-            logger.warning(f"데이터베이스 연결 확인 실패: {e}")
-            db_connected = False
-        
-        status = "healthy" if db_connected else "degraded"
-        
-        return HealthResponse(
-            status=status,
-            database_connected=db_connected
-        )
-        
+            logger.warning(f"캐시 갱신 실패 ({key}): {e}")
+        else:
+            # 다음 갱신이 한 번 늦어져도 캐시가 유지되도록 주기의 2배로 저장
+            response_cache.set(key, value, interval * 2)
+        await asyncio.sleep(interval)
+
+
+async def run_database_probe_loop():
+    """연결 상태를 주기적으로 확인하여 캐시 갱신"""
+    await _refresh_cache_periodically("db_connected", HEALTH_PROBE_INTERVAL, _probe_database)
+
+
+async def warm_database_info():
+    """
+    시작 시 데이터베이스 정보 스냅샷을 한 번 채움 (lifespan에서 태스크로 실행)
+    
+    이후 갱신은 요청이 있을 때만 수행하여 호출이 없는 동안 전체 테이블 COUNT를 반복하지 않음
+    """
+    try:
+        await _get_database_info_snapshot()
+        logger.info("데이터베이스 정보 스냅샷 준비 완료")
     except Exception as e:
-        logger.error(f"헬스체크 오류: {str(e)}")
-        return HealthResponse(
-            status="unhealthy",
-            database_connected=False
-        )
+        logger.warning(f"데이터베이스 정보 스냅샷 준비 실패: {e}")
 
 
-@router.get("/database-info")
-async def get_database_info():
-    """데이터베이스 전체 정보 조회 - DI 기반"""
+@router.get("/health", response_model=HealthResponse)
+async def health_check() -> Response:
+    """
+    서비스 상태 확인 - DI 기반
+    
+    프로브가 자주 호출하는 경로이므로 response_model 검증 없이 바로 직렬화
+    (응답 필드는 HealthResponse와 동일하게 유지)
+    """
     try:
-        db_service = await get_database_service()
-        
-        # 테이블 목록과 레코드 수 조회
-        tables_info = []
-        tables = await db_service.get_all_tables()
-        
-        for table_name in tables:
-            try:
-                # 레코드 수 조회
-                count_query = f"SELECT COUNT(*) as count FROM {table_name}"
-                count_result = await db_service.execute_custom_query(count_query)
-                row_count = count_result.data[0]['count'] if count_result.success and count_result.data else 0
-                
-                tables_info.append({
-                    "table_name": table_name,
-                    "row_count": row_count
-                })
-            except Exception as e:
-                logger.warning(f"테이블 {table_name} 정보 조회 실패: {e}")
-                tables_info.append({
-                    "table_name": table_name,
-                    "row_count": 0
-                })
-        
-        # 샘플 데이터 조회 (population_stats 테이블)
-        sample_data = ""
-        try:
-            sample_query = """
-            SELECT adm_cd, adm_nm, year, tot_ppltn as population 
-            FROM population_stats 
-            WHERE year = 2023 
-            ORDER BY tot_ppltn DESC 
-            LIMIT 5
-            """
-            sample_result = await db_service.execute_custom_query(sample_query)
-            
-            if sample_result.success and sample_result.data:
-                sample_data = "최신 인구 통계 (2023년):\n"
-                for row in sample_result.data:
-                    sample_data += f"- {row['adm_nm']}: {row['population']:,}명\n"
-        except Exception as e:
-            logger.warning(f"샘플 데이터 조회 실패: {e}")
-            sample_data = "샘플 데이터를 조회할 수 없습니다."
-        
-        return {
-            "success": True,
-            "tables": tables_info,
-            "sample_data": sample_data,
-            "total_tables": len(tables_info)
+        db_connected = await is_database_connected()
+    except Exception as e:
+        logger.warning(f"데이터베이스 연결 확인 실패: {e}")
+        db_connected = False
+    
+    return Response(
+        content=orjson.dumps({
+            "status": "healthy" if db_connected else "degraded",
+            "timestamp": datetime.now(),
+            "version": None,
+            "services": {},
+            "database_connected": db_connected
+        }),
+        media_type="application/json"
+    )
+
+
+async def _fetch_tables_info(db_service) -> List[Dict[str, Any]]:
+    """테이블 목록과 레코드 수 조회 (레코드 수는 단일 쿼리로 일괄 조회)"""
+    tables = await db_service.get_all_tables()
+    row_counts = await db_service.get_table_row_counts(tables)
+    
+    return [
+        {
+            "table_name": table_name,
+            "row_count": row_counts.get(table_name, 0)
         }
+        for table_name in tables
+    ]
+
+
+async def _fetch_sample_data(db_service) -> str:
+    """샘플 데이터 조회 (population_stats 테이블)"""
+    sample_data = ""
+    try:
+        sample_query = """
+        SELECT adm_cd, adm_nm, year, tot_ppltn as population 
+        FROM population_stats 
+        WHERE year = :year 
+        ORDER BY tot_ppltn DESC 
+        LIMIT 5
+        """
+        sample_result = await db_service.execute_custom_query(sample_query, {"year": 2023})
         
+        if sample_result.success and sample_result.data:
+            sample_data = "최신 인구 통계 (2023년):\n"
+            for row in sample_result.data:
+                sample_data += f"- {row['adm_nm']}: {row['population']:,}명\n"
+    except Exception as e:
+        logger.warning(f"샘플 데이터 조회 실패: {e}")
+        sample_data = "샘플 데이터를 조회할 수 없습니다."
+    
+    return sample_data
+
+
+async def _build_database_info() -> bytes:
+    """데이터베이스 정보 응답 생성 - 캐시되므로 직렬화도 갱신 시 한 번만 수행"""
+    db_service = await get_database_service()
+    
+    # 테이블 정보와 샘플 데이터는 서로 독립적이므로 동시에 조회
+    tables_info, sample_data = await asyncio.gather(
+        _fetch_tables_info(db_service),
+        _fetch_sample_data(db_service)
+    )
+    
+    return orjson.dumps({
+        "success": True,
+        "tables": tables_info,
+        "sample_data": sample_data,
+        "total_tables": len(tables_info)
+    })
+
+
+async def _load_database_info() -> bytes:
+    """스냅샷을 새로 만들고 스트림 구독자에게 알림 (응답 캐시의 factory)"""
+    content = await _build_database_info()
+    # get_or_set은 factory 반환 직후 await 없이 캐시에 저장하므로 깨어난 구독자는 새 스냅샷을 읽음
+    # (set()은 현재 대기 중인 구독자를 모두 깨우므로 바로 clear해도 됨)
+    _database_info_updated.set()
+    _database_info_updated.clear()
+    return content
+
+
+async def _get_database_info_snapshot() -> bytes:
+    """
+    데이터베이스 정보 스냅샷 조회
+    
+    스냅샷이 없을 때만 직접 조회하고, TTL이 지난 스냅샷은 바로 반환하면서 백그라운드로 갱신
+    (캐시에는 orjson으로 직렬화된 bytes가 저장되어 요청마다 인코딩하지 않음)
+    """
+    return await response_cache.get_or_set(
+        "database_info",
+        DATABASE_INFO_CACHE_TTL,
+        _load_database_info,
+        stale_while_revalidate=True
+    )
+
+
+@router.get("/database-info")
+async def get_database_info() -> Response:
+    """데이터베이스 전체 정보 조회 - 캐시된 스냅샷 반환"""
+    try:
+        content = await _get_database_info_snapshot()
+    
     except Exception as e:
         logger.error(f"데이터베이스 정보 조회 오류: {str(e)}")
-        return {
+        content = orjson.dumps({
             "success": False,
             "error": str(e),
             "tables": [],
             "sample_data": "",
             "total_tables": 0
-        }
\ No newline at end of file
+        })
+    
+    return Response(content=content, media_type="application/json")
+
+
+async def _stream_database_info() -> AsyncGenerator[bytes, None]:
+    """스냅샷이 바뀔 때만 SSE 프레임으로 전송하고, 그 사이에는 keep-alive 주석만 전송"""
+    last_content = None
+    while True:
+        try:
+            content = await _get_database_info_snapshot()
+        except Exception as e:
+            # 조회 실패 시 클라이언트는 마지막 스냅샷을 유지
+            logger.warning(f"데이터베이스 정보 스트림 갱신 실패: {e}")
+        else:
+            if content != last_content:
+                last_content = content
+                yield sse_frame(content)
+        
+        try:
+            await asyncio.wait_for(
+                _database_info_updated.wait(), DATABASE_INFO_KEEPALIVE_INTERVAL
+            )
+        except asyncio.TimeoutError:
+            yield b": keep-alive\n\n"
+
+
+@router.get("/database-info/stream")
+async def stream_database_info() -> StreamingResponse:
+    """
+    데이터베이스 정보 스트림 (SSE)
+    
+    대시보드가 /database-info를 주기적으로 폴링하는 대신 한 번 연결해 두면
+    스냅샷이 새로 만들어질 때마다 변경된 경우에만 전송
+    (연결된 동안에는 keep-alive 주기마다 스냅샷을 확인하므로 TTL이 지나면 갱신됨)
+    """
+    return StreamingResponse(
+        _stream_database_info(),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
@@ -0,0 +1,20 @@
+"""
+SSE 응답 공통 구성 - 스트리밍 엔드포인트가 같은 헤더와 프레임 형식을 사용
+"""
+
+# SSE 응답 헤더 - 요청마다 dict를 새로 만들지 않도록 모듈 상수로 유지
+SSE_HEADERS = {
+    "Cache-Control": "no-cache, no-transform",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",  # nginx 등 리버스 프록시의 응답 버퍼링 비활성화
+    "Access-Control-Allow-Origin": "*"
+}
+
+# SSE 프레임 구분자
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+
+def sse_frame(payload: bytes) -> bytes:
+    """SSE data 프레임 생성 - 단일 join으로 한 번에 할당"""
+    return b"".join((_SSE_PREFIX, payload, _SSE_SUFFIX))
@@ -4,11 +4,17 @@ LangGraph의 실제 토큰 스트리밍을 활용한 개선된 UI
 """
 import streamlit as st
 import requests
-import json
-import uuid
+import orjson
+import os
+import queue
+import secrets
 import time
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, Any, Generator
+from typing import Dict, Any, Generator, Optional
+from streamlit.runtime.scriptrunner import add_script_run_ctx
 
 # 페이지 설정 구성
 st.set_page_config(
@@ -17,36 +23,184 @@ st.set_page_config(
     layout="centered"
 )
 
+# 응답 렌더링 주기 - 토큰마다 전체 응답을 다시 그리지 않도록 시간/토큰 수 기준으로 묶어서 갱신
+RESPONSE_FLUSH_INTERVAL = 0.08  # 초
+RESPONSE_FLUSH_TOKENS = 16
+
+# 상세 진행 로그에 표시할 최근 항목 수 (그 이전 항목은 보관하지 않음)
+LOG_DISPLAY_LINES = 3
+
+# 네트워크 읽기 스레드와 UI 사이의 버퍼 크기 (청크 수)
+STREAM_QUEUE_SIZE = 256
+_STREAM_END = object()
+
+# 청크가 오지 않을 때 UI에 제어를 돌려주는 간격 (초) - 생성 중지 클릭은 다음 UI 갱신 때 반영됨
+STREAM_IDLE_INTERVAL = 0.2
+
+# SSE 데이터 프레임 접두사
+SSE_DATA_PREFIX = b"data: "
+
+# 스트리밍 요청 헤더 - 이벤트 스트림을 요청하고 keep-alive 연결을 유지
+# (중간 프록시가 버퍼링하지 않도록 no-cache 요청, 서버도 X-Accel-Buffering: no로 응답)
+SSE_REQUEST_HEADERS = {
+    "Content-Type": "application/json",  # 요청 본문은 orjson으로 직접 인코딩
+    "Accept": "text/event-stream",
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive"
+}
+
+# 스트리밍 요청 타임아웃 (연결, 읽기) - 연결 실패는 빠르게 감지하고 읽기는 청크 간 대기 시간 기준
+SSE_REQUEST_TIMEOUT = (5, 30)
+
+# 대화 기록 표시 개수 - 긴 세션에서도 재실행마다 그리는 메시지 수를 일정하게 유지
+HISTORY_RENDER_LIMIT = 50
+
+# API 상태 확인 주기 (초) - 렌더링 경로에서는 마지막 결과만 읽음
+HEALTH_POLL_INTERVAL = 15.0
+
 # 세션 상태 초기화
 if "messages" not in st.session_state:
     st.session_state.messages = []
 if "session_id" not in st.session_state:
-    st.session_state.session_id = str(uuid.uuid4())
+    st.session_state.session_id = secrets.token_hex(16)
+
+# HTTP 세션 - 재실행/요청마다 새 TCP 연결을 맺지 않도록 프로세스 전체에서 keep-alive 연결 재사용
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """
+    연결 풀을 가진 공유 requests.Session 반환
+    
+    모든 브라우저 세션, 백그라운드 스트림 스레드, 헬스 폴러가 함께 사용하므로
+    동시 스트림이 늘어도 연결을 버리고 새로 맺지 않도록 호스트당 풀을 넉넉히 유지
+    """
+    session = requests.Session()
+    session.headers["Connection"] = "keep-alive"
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 # API URL 설정
-def get_api_base_url():
-    """환경에 따른 API URL 반환"""
+@st.cache_resource(ttl=3600, show_spinner=False)
+def discover_api_base_url() -> str:
+    """
+    환경에 따른 API URL 탐색
+    
+    PAI_API_URL 환경변수가 있으면 탐색 없이 사용하고,
+    그 외에는 후보 URL에 HEAD 요청으로 확인
+    Streamlit은 상호작용마다 스크립트를 재실행하므로 프로세스당 한 번만 탐색하도록 캐시
+    (응답한 후보가 없으면 예외를 발생시켜 실패 결과는 캐시하지 않음)
+    """
+    base_url = os.getenv("PAI_API_URL")
+    if base_url:
+        return base_url.rstrip("/")
+    
     urls_to_try = [
         "http://app:8000",           # Docker 환경
         "http://localhost:8000",     # 로컬
         "http://127.0.0.1:8000"      # 대체
     ]
     
-    for url in urls_to_try:
-        try:
-            response = requests.get(f"{url}/", timeout=2)
-            if response.status_code == 200:
-                return url
-        except:
-            continue
+    # 후보를 동시에 확인하고 가장 먼저 응답한 URL 사용 (최악의 경우도 타임아웃 한 번)
+    # 응답 상태와 무관하게 응답이 오면 서버가 떠 있는 것 (HEAD는 본문 전송 없음)
+    executor = ThreadPoolExecutor(max_workers=len(urls_to_try))
+    futures = {
+        executor.submit(get_http_session().head, f"{url}/", timeout=0.5): url
+        for url in urls_to_try
+    }
+    try:
+        for future in as_completed(futures):
+            if future.exception() is None:
+                return futures[future]
+    finally:
+        # 나머지 프로브는 기다리지 않음
+        executor.shutdown(wait=False, cancel_futures=True)
     
-    return "http://localhost:8000"
+    raise ConnectionError(f"응답하는 API 서버가 없습니다: {', '.join(urls_to_try)}")
+
+def get_api_base_url() -> str:
+    """API URL 반환 - 탐색에 실패하면 기본 주소를 사용하고 다음 재실행에서 다시 탐색"""
+    try:
+        return discover_api_base_url()
+    except ConnectionError:
+        return "http://localhost:8000"
 
 API_BASE_URL = get_api_base_url()
 
+# SSE 파싱
+def split_lines(byte_chunks) -> Generator[bytes, None, None]:
+    """
+    바이트 청크 스트림을 줄 단위로 분리 (iter_lines 대신 큰 청크로 읽고 디코딩 없이 bytes로 처리)
+    
+    스트림이 끝나면 남은 줄과 빈 줄을 내보내 마지막 이벤트가 항상 마무리되도록 함
+    """
+    buffer = bytearray()
+    for chunk in byte_chunks:
+        scan_from = len(buffer)
+        buffer += chunk
+        
+        # 새로 받은 부분에 줄바꿈이 없으면 계속 누적 (여러 청크에 걸친 긴 줄을 매번 다시 복사/스캔하지 않음)
+        end = buffer.rfind(b"\n", scan_from)
+        if end < 0:
+            continue
+        lines = bytes(buffer[:end]).split(b"\n")
+        del buffer[:end + 1]
+        yield from lines
+    
+    if buffer:
+        yield bytes(buffer)
+    yield b""
+
+def iter_sse_events(byte_chunks) -> Generator[Dict[str, Any], None, None]:
+    """
+    SSE 바이트 스트림을 이벤트 단위로 파싱
+    
+    - 빈 줄에서 이벤트 종료: 연속된 data: 줄은 줄바꿈으로 이어 붙여 하나의 JSON으로 해석
+    - event: 값은 JSON에 type이 없을 때 type으로 사용
+    - ':'로 시작하는 주석(keep-alive)과 id:, retry: 등 그 외 필드는 무시
+    """
+    data_lines = []
+    event_type = None
+    
+    for line in split_lines(byte_chunks):
+        line = line.removesuffix(b"\r")
+        
+        if not line:
+            if data_lines:
+                data = data_lines[0] if len(data_lines) == 1 else b"\n".join(data_lines)
+                try:
+                    event = orjson.loads(data)
+                except orjson.JSONDecodeError:
+                    event = None
+                
+                if isinstance(event, dict):
+                    if event_type and "type" not in event:
+                        event["type"] = event_type
+                    if event.get("type") != "keepalive":
+                        yield event
+            
+            data_lines = []
+            event_type = None
+            continue
+        
+        # 일반적인 "data: " 형식은 removeprefix 한 번으로 처리 (접두사가 없으면 원본 객체 반환)
+        payload = line.removeprefix(SSE_DATA_PREFIX)
+        if payload is not line:
+            data_lines.append(payload)
+        elif line.startswith(b"data:"):
+            data_lines.append(line[5:])
+        elif line.startswith(b"event:"):
+            event_type = line[6:].strip().decode()
+
 # API 호출 함수 (통합 스트리밍)
-def call_agent_stream(question: str) -> Generator[Dict[str, Any], None, None]:
-    """통합 스트리밍 API 호출 - 멀티턴 대화 지원"""
+def call_agent_stream(
+    question: str, response_holder: Optional[Dict[str, Any]] = None
+) -> Generator[Dict[str, Any], None, None]:
+    """
+    통합 스트리밍 API 호출 - 멀티턴 대화 지원
+    
+    response_holder가 주어지면 다른 스레드에서 연결을 닫을 수 있도록 응답 객체를 담아 둠
+    """
     try:
         url = f"{API_BASE_URL}/api/agent/query"
         payload = {
@@ -55,37 +209,172 @@ def call_agent_stream(question: str) -> Generator[Dict[str, Any], None, None]:
             "thread_id": st.session_state.session_id  # 멀티턴 대화 지원
         }
         
-        response = requests.post(url, json=payload, stream=True, timeout=30)
-        response.raise_for_status()
-        
-        for line in response.iter_lines():
-            if line and line.startswith(b'data: '):
-                try:
-                    data = json.loads(line[6:])
-                    yield data
-                except json.JSONDecodeError:
-                    continue
-                    
+        # 중간에 중단되어도 연결이 풀로 반환되도록 컨텍스트 매니저로 응답을 닫음
+        with get_http_session().post(
+            url,
+            data=orjson.dumps(payload),
+            stream=True,
+            timeout=SSE_REQUEST_TIMEOUT,
+            headers=SSE_REQUEST_HEADERS
+        ) as response:
+            if response_holder is not None:
+                response_holder["response"] = response
+            response.raise_for_status()
+            
+            yield from iter_sse_events(response.iter_content(chunk_size=8192, decode_unicode=False))
+    
     except Exception as e:
         yield {"type": "error", "content": str(e)}
 
-def check_api_health() -> bool:
+def check_api_health(base_url: str) -> bool:
     """API 서버 상태 확인"""
     try:
-        response = requests.get(f"{API_BASE_URL}/api/data/health", timeout=3)
+        response = get_http_session().get(f"{base_url}/api/data/health", timeout=3)
         return response.status_code == 200
     except:
         return False
 
+class HealthPoller:
+    """
+    API 상태를 백그라운드 스레드에서 확인하는 폴러
+    
+    poll()은 마지막 확인 결과를 바로 반환하고, 결과가 HEALTH_POLL_INTERVAL보다
+    오래되었으면 다음 확인을 백그라운드로 예약 (첫 확인만 결과를 기다림)
+    """
+    
+    def __init__(self, base_url: str, interval: float):
+        self._base_url = base_url
+        self._interval = interval
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="api-health")
+        self._lock = threading.Lock()
+        self._future: Optional[Future] = None
+        self._checked_at = 0.0
+        self._status: Optional[bool] = None
+    
+    def poll(self) -> bool:
+        with self._lock:
+            if self._future is not None and self._future.done():
+                self._status = self._future.result()
+                self._future = None
+            
+            if self._future is None and time.monotonic() - self._checked_at > self._interval:
+                self._checked_at = time.monotonic()
+                self._future = self._executor.submit(check_api_health, self._base_url)
+            
+            future = self._future if self._status is None else None
+        
+        # 프로세스 첫 렌더링에는 표시할 결과가 없으므로 한 번만 기다림
+        if future is not None:
+            return future.result()
+        return self._status
+
+@st.cache_resource
+def get_health_poller(base_url: str) -> HealthPoller:
+    """API 주소별 상태 폴러 반환 (모든 세션이 공유, 주소가 바뀌면 새 폴러 사용)"""
+    return HealthPoller(base_url, HEALTH_POLL_INTERVAL)
+
+def stream_in_background(question: str) -> Generator[Optional[Dict[str, Any]], None, None]:
+    """
+    call_agent_stream을 백그라운드 스레드에서 읽고 큐를 통해 청크 전달
+    
+    UI가 응답을 그리는 동안에도 소켓을 계속 읽어 서버 쪽 백프레셔와 토큰 간 지연을 줄임
+    STREAM_IDLE_INTERVAL 동안 청크가 없으면 None을 내보내 호출자가 UI를 갱신할 수 있게 함
+    (첫 토큰이나 도구 결과를 기다리는 동안에도 생성 중지가 바로 반영되도록)
+    호출자가 중간에 중단하면 응답 연결을 바로 닫아 소켓 읽기에서 대기 중인 스레드도 멈춤
+    """
+    chunks = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+    stopped = threading.Event()
+    response_holder: Dict[str, Any] = {}
+    
+    def put(item) -> bool:
+        # 소비자가 멈춘 뒤 큐가 가득 차 있어도 영원히 대기하지 않도록 주기적으로 확인
+        while not stopped.is_set():
+            try:
+                chunks.put(item, timeout=0.2)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce():
+        stream = call_agent_stream(question, response_holder)
+        try:
+            for chunk in stream:
+                if not put(chunk):
+                    break
+        finally:
+            stream.close()
+            put(_STREAM_END)
+    
+    # 세션 상태/캐시에 접근할 수 있도록 현재 스크립트 컨텍스트를 스레드에 연결
+    producer = threading.Thread(target=produce, name="agent-stream", daemon=True)
+    add_script_run_ctx(producer)
+    producer.start()
+    
+    finished = False
+    try:
+        while True:
+            try:
+                chunk = chunks.get(timeout=STREAM_IDLE_INTERVAL)
+            except queue.Empty:
+                yield None
+                continue
+            if chunk is _STREAM_END:
+                finished = True
+                return
+            yield chunk
+    finally:
+        stopped.set()
+        # 중간에 중단된 경우 생산자가 iter_content에서 다음 청크를 기다리고 있으므로
+        # 소켓 읽기를 끊고 응답을 닫아 즉시 빠져나오게 함 (서버도 연결 종료를 감지해 중단)
+        response = response_holder.get("response")
+        if not finished and response is not None:
+            try:
+                response.raw.shutdown()
+            except (AttributeError, ValueError):
+                pass  # urllib3 2.3 미만이거나 소켓 정보가 없으면 close만 수행
+            response.close()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_database_info(base_url: str) -> Dict[str, Any]:
+    """데이터베이스 정보 조회 (스키마/레코드 수는 거의 변하지 않으므로 5분간 캐시, 실패는 캐시하지 않음)"""
+    response = get_http_session().get(f"{base_url}/api/data/database-info", timeout=10)
+    response.raise_for_status()
+    db_info = response.json()
+    if not db_info.get("success"):
+        raise RuntimeError(db_info.get("error", "Unknown"))
+    return db_info
+
 def get_database_info() -> Dict[str, Any]:
     """데이터베이스 정보 조회"""
     try:
-        response = requests.get(f"{API_BASE_URL}/api/data/database-info", timeout=10)
-        response.raise_for_status()
-        return response.json()
+        return fetch_database_info(API_BASE_URL)
     except Exception as e:
         return {"success": False, "error": str(e)}
 
+def format_used_tools(used_tools) -> str:
+    """사용된 도구 목록을 한 번의 렌더링으로 표시할 마크다운 문자열로 변환"""
+    return "\n".join(
+        f"- {'✅' if tool.get('success', False) else '❌'} {i}. {tool.get('tool_name', 'Unknown')}"
+        for i, tool in enumerate(used_tools, 1)
+    )
+
+# 사이드바 사용 가이드 (정적 콘텐츠)
+GUIDE_MD = """
+**인구 통계 질문 예시:**
+- 2023년 서울시 인구는?
+- 2022년 경기도 인구는?
+- 2020년 전국 시도별 평균 연령이 가장 높은 곳은?
+
+**가구/주택 통계:**
+- 2020년 전라남도 평균 가구원수는 얼마인가요?
+- 2020년 경기도 평균 가구원수는 얼마인가요?
+
+**사업체 통계:**
+- 2023년 부산시 사업체 수는?
+- 전국에서 사업체가 가장 많은 지역은?
+"""
+
 # ====== UI 구성 ======
 
 # 헤더
@@ -93,29 +382,22 @@ st.title("🤖 PAI SQL Agent")
 st.markdown("**한국 통계청 데이터 분석 AI 에이전트 - 실시간 스트리밍**")
 
 # API 상태 확인
-if check_api_health():
+if get_health_poller(API_BASE_URL).poll():
     st.success(f"✅ API 서버 연결됨")
 else:
     st.error(f"❌ API 서버 연결 실패")
 
 # 사이드바
-with st.sidebar:
-    st.header("📋 사용 가이드")
-    
-    st.markdown("""
-    **인구 통계 질문 예시:**
-    - 2023년 서울시 인구는?
-    - 2022년 경기도 인구는?
-    - 2020년 전국 시도별 평균 연령이 가장 높은 곳은?
+@st.fragment
+def render_sidebar():
+    """
+    사이드바 렌더링
     
-    **가구/주택 통계:**
-    - 2020년 전라남도 평균 가구원수는 얼마인가요?
-    - 2020년 경기도 평균 가구원수는 얼마인가요?
+    fragment로 분리하여 데이터베이스 정보 조회 버튼을 눌러도 대화 영역은 다시 실행하지 않음
+    """
+    st.header("📋 사용 가이드")
     
-    **사업체 통계:**
-    - 2023년 부산시 사업체 수는?
-    - 전국에서 사업체가 가장 많은 지역은?
-    """)
+    st.markdown(GUIDE_MD)
     
     st.markdown("---")
     st.header("🗄️ 데이터베이스 정보")
@@ -131,10 +413,11 @@ with st.sidebar:
                 # 테이블 정보 표시
                 if "tables" in db_info:
                     st.write("**📊 테이블 정보:**")
-                    for table in db_info["tables"]:
-                        table_name = table.get("table_name", "Unknown")
-                        row_count = table.get("row_count", 0)
-                        st.write(f"• {table_name}: {row_count:,}개 레코드")
+                    # 테이블마다 st.write를 호출하지 않고 한 번에 렌더링
+                    st.markdown("\n".join(
+                        f"- {table.get('table_name', 'Unknown')}: {table.get('row_count', 0):,}개 레코드"
+                        for table in db_info["tables"]
+                    ))
                 
                 # 샘플 데이터 표시
                 if "sample_data" in db_info:
@@ -147,32 +430,52 @@ with st.sidebar:
     
     # 세션 정보 간단 표시
     st.write(f"**세션 ID**: `{st.session_state.session_id[:8]}...`")
+    
+    # API 서버 주소는 프로세스당 한 번만 탐색하므로 서버 이동 시 수동으로 다시 탐색
+    # (이전 서버 기준으로 캐시된 DB 정보와 상태 폴러도 함께 비움)
+    if st.button("🔄 API 서버 다시 찾기", key="rediscover_api"):
+        discover_api_base_url.clear()
+        fetch_database_info.clear()
+        get_health_poller.clear()
+        st.rerun()
+
+with st.sidebar:
+    render_sidebar()
 
 # 대화 기록 표시
 st.markdown("---")
 st.subheader("💬 대화")
 
-# 기존 메시지 표시
-for message in st.session_state.messages:
-    with st.chat_message(message["role"]):
+# 기존 메시지 표시 - 최근 HISTORY_RENDER_LIMIT개만 그리고, 그 이전 메시지는 토글을 켰을 때만 표시
+messages = st.session_state.messages
+hidden_count = len(messages) - HISTORY_RENDER_LIMIT
+if hidden_count > 0 and not st.toggle(f"이전 메시지 {hidden_count}개 보기", key="show_full_history"):
+    messages = messages[-HISTORY_RENDER_LIMIT:]
+for message in messages:
+    role = message["role"]
+    with st.chat_message(role):
         st.write(message["content"])
         
+        # 사용자 메시지는 부가 정보 없음
+        if role != "assistant":
+            continue
+        
         # 도구 사용 정보 (AI 응답)
-        if message["role"] == "assistant" and "used_tools" in message:
-            if message["used_tools"]:
-                with st.expander("🛠️ 사용된 도구"):
-                    for i, tool in enumerate(message["used_tools"], 1):
-                        tool_name = tool.get("tool_name", "Unknown")
-                        success = tool.get("success", False)
-                        status = "✅" if success else "❌"
-                        st.write(f"{status} {i}. {tool_name}")
+        used_tools = message.get("used_tools")
+        if used_tools:
+            # 메시지 저장 시 만들어 둔 요약을 사용하여 재실행마다 도구별 위젯을 만들지 않음
+            tools_summary = message.get("tools_summary") or format_used_tools(used_tools)
+            with st.expander("🛠️ 사용된 도구"):
+                st.markdown(tools_summary)
         
         # 스트리밍 정보 표시 (간소화)
-        if message["role"] == "assistant" and "streaming_info" in message:
-            info = message["streaming_info"]
+        info = message.get("streaming_info")
+        if info is not None:
             with st.expander("📊 스트리밍 정보"):
-                st.write(f"🟢 토큰 수: {info.get('total_tokens', 0)}")
-                st.write(f"🟣 도구 실행: {info.get('tools_executed', 0)}")
+                st.markdown(
+                    f"🟢 토큰 수: {info.get('total_tokens', 0)}  \n"
+                    f"🟣 도구 실행: {info.get('tools_executed', 0)}"
+                )
         
 
 # 사용자 입력
@@ -188,30 +491,52 @@ if prompt := st.chat_input("센서스 데이터에 대해 질문해보세요..."
     with st.chat_message("assistant"):
         response_container = st.empty()
         
-        # 간단한 Progress Bar
+        # 간단한 Progress Bar (상태 문구도 진행률 표시줄의 text로 함께 갱신)
         progress_bar = st.progress(0)
-        status_text = st.empty()
         
         # 상세 로그 (접을 수 있음)
         with st.expander("🔍 상세 진행 로그", expanded=False):
             log_container = st.empty()
-            log_content = []
+            log_content = deque(maxlen=LOG_DISPLAY_LINES)
+        
+        # 생성 중지 버튼 - 누르면 Streamlit이 현재 실행을 중단하고 재실행하며,
+        # 스트림 제너레이터가 닫히면서 응답 연결도 바로 닫힘 (서버도 연결 종료를 감지해 중단)
+        stop_slot = st.empty()
+        stop_slot.button("⏹ 생성 중지", key="stop_generating")
+        
+        response_parts = []  # 토큰은 리스트에 모으고 렌더링할 때만 join
+        used_tools = []
+        answer_saved = False
         
         try:
             full_response = ""
             current_progress = 0
-            used_tools = []
             streaming_info = {}
+            last_flush = time.monotonic()
+            pending_tokens = 0
+            last_status = ""  # 같은 진행률/상태를 연속으로 다시 그리지 않도록 마지막 표시 내용 보관
             
             with st.spinner("🤖 AI가 답변을 생성하는 중..."):
-                for chunk in call_agent_stream(prompt):
+                for chunk in stream_in_background(prompt):
+                    # 대기 중에는 진행 상태를 다시 그려 Streamlit이 생성 중지 요청을 처리할 기회를 줌
+                    if chunk is None:
+                        progress_bar.progress(current_progress, text=last_status or None)
+                        continue
+                    
                     chunk_type = chunk.get("type", "unknown")
                     
                     # AI 메시지 토큰 스트리밍
                     if chunk_type == "ai_message":
                         token_content = chunk.get("content", "")
-                        full_response += token_content
-                        response_container.write(full_response + "▌")
+                        response_parts.append(token_content)
+                        pending_tokens += 1
+                        
+                        now = time.monotonic()
+                        if now - last_flush > RESPONSE_FLUSH_INTERVAL or pending_tokens >= RESPONSE_FLUSH_TOKENS:
+                            full_response = "".join(response_parts)
+                            response_container.write(full_response + "▌")
+                            last_flush = now
+                            pending_tokens = 0
                     
                     # 도구 호출 시작
                     elif chunk_type == "tool_call":
@@ -221,27 +546,27 @@ if prompt := st.chat_input("센서스 데이터에 대해 질문해보세요..."
                         }
                         used_tools.append(tool_info)
                         
-                        current_progress = 50
-                        progress_bar.progress(current_progress)
-                        status_text.text(f"🔧 도구 실행 중: {tool_info['tool_name']}")
+                        status_message = f"🔧 도구 실행 중: {tool_info['tool_name']}"
+                        if current_progress != 50 or status_message != last_status:
+                            current_progress = 50
+                            last_status = status_message
+                            progress_bar.progress(current_progress, text=status_message)
                         
-                        # 로그 추가
-                        current_time = datetime.now().strftime("%H:%M:%S")
-                        log_content.append(f"도구 호출: {tool_info['tool_name']}")
-                        log_text = "\n".join([f"[{current_time}] {msg}" for msg in log_content[-3:]])
-                        log_container.text(log_text)
+                        # 로그 추가 (시각은 추가할 때 한 번만 포맷)
+                        log_content.append(f"[{datetime.now():%H:%M:%S}] 도구 호출: {tool_info['tool_name']}")
+                        log_container.text("\n".join(log_content))
                     
                     # 도구 실행 결과
                     elif chunk_type == "tool_result":
-                        current_progress = 90
-                        progress_bar.progress(current_progress)
-                        status_text.text("📊 데이터 조회 완료")
+                        status_message = "📊 데이터 조회 완료"
+                        if current_progress != 90 or status_message != last_status:
+                            current_progress = 90
+                            last_status = status_message
+                            progress_bar.progress(current_progress, text=status_message)
                         
                         # 로그 추가
-                        current_time = datetime.now().strftime("%H:%M:%S")
-                        log_content.append("데이터 조회 완료")
-                        log_text = "\n".join([f"[{current_time}] {msg}" for msg in log_content[-3:]])
-                        log_container.text(log_text)
+                        log_content.append(f"[{datetime.now():%H:%M:%S}] 데이터 조회 완료")
+                        log_container.text("\n".join(log_content))
                     
                     # 에러 처리
                     elif chunk_type == "error":
@@ -249,29 +574,31 @@ if prompt := st.chat_input("센서스 데이터에 대해 질문해보세요..."
                         break
         
             # 완료 후 정리
+            stop_slot.empty()
+            full_response = "".join(response_parts)
             if full_response:
                 response_container.write(full_response)
                 
                 # 최종 진행률
-                progress_bar.progress(100)
-                status_text.text("✅ 완료!")
+                progress_bar.progress(100, text="✅ 완료!")
                 
                 # 성공적인 응답을 세션 상태에 저장 (간소화)
                 assistant_message = {
                     "role": "assistant",
                     "content": full_response,
                     "used_tools": used_tools,
+                    "tools_summary": format_used_tools(used_tools),
                     "streaming_info": {
                         "tools_executed": len(used_tools),
                         "total_tokens": len(full_response.split()) if full_response else 0
                     }
                 }
                 st.session_state.messages.append(assistant_message)
+                answer_saved = True
                 
                 # UI 정리
                 time.sleep(1)
                 progress_bar.empty()
-                status_text.empty()
         
         except Exception as e:
             response_container.error(f"클라이언트 오류: {str(e)}")
@@ -280,6 +607,17 @@ if prompt := st.chat_input("센서스 데이터에 대해 질문해보세요..."
                 "content": f"죄송합니다. 클라이언트 오류가 발생했습니다: {str(e)}",
                 "used_tools": []
             })
+            answer_saved = True
+        
+        finally:
+            # 생성 중지로 실행이 중단된 경우 받은 부분까지 기록
+            if not answer_saved and response_parts:
+                st.session_state.messages.append({
+                    "role": "assistant",
+                    "content": "".join(response_parts) + "\n\n_(생성 중지됨)_",
+                    "used_tools": used_tools,
+                    "tools_summary": format_used_tools(used_tools)
+                })
 
 # 푸터
 st.markdown("---")